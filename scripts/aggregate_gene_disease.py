@@ -1,8 +1,15 @@
 """Aggregate ClinGen variant data to gene-disease associations using DuckDB."""
 
-import duckdb
+import sys
 from pathlib import Path
 
+import duckdb
+
+INGEST_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(INGEST_DIR / "src"))
+
+from versions import write_clingen_version_sidecar  # noqa: E402
+
 INPUT_FILE = Path("data/clingen_variants.tsv")
 OUTPUT_FILE = Path("data/clingen_gene_disease.tsv")
 
@@ -59,5 +66,12 @@ def aggregate_gene_disease():
     con.close()
 
 
+def stamp_source_version():
+    """Record the ClinGen source version in a sidecar so metadata emission can skip the scan."""
+    version, method = write_clingen_version_sidecar(INPUT_FILE.resolve())
+    print(f"ClinGen source version: {version} via {method}")
+
+
 if __name__ == "__main__":
     aggregate_gene_disease()
+    stamp_source_version()
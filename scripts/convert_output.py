@@ -0,0 +1,99 @@
+"""Rewrite Koza's plain KGX TSV output into the format configured per transform using DuckDB.
+
+Koza always writes `<name>_nodes.tsv` / `<name>_edges.tsv`. Most columns repeat
+the same handful of constants, so compressed or columnar output is much smaller
+and faster to parse downstream. The format for each transform is set in
+output_formats.yaml; transforms set to `tsv` (or not listed) are left untouched.
+JSONL and Parquet output is typed like KGX JSONL: multivalued columns become
+lists and `negated` a boolean, rather than the TSV's pipe-joined text.
+"""
+
+from pathlib import Path
+
+import duckdb
+import yaml
+
+INGEST_DIR = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = INGEST_DIR / "output"
+FORMATS_YAML = INGEST_DIR / "output_formats.yaml"
+
+# Output format -> (file suffix, DuckDB COPY options, whether columns are typed)
+# TSV stays text exactly as Koza wrote it; JSONL and Parquet get KGX types (lists, booleans).
+COPY_OPTIONS = {
+    "tsv.gz": ("tsv.gz", "FORMAT csv, DELIMITER '\t', HEADER, QUOTE '', COMPRESSION gzip", False),
+    "tsv.zst": ("tsv.zst", "FORMAT csv, DELIMITER '\t', HEADER, QUOTE '', COMPRESSION zstd", False),
+    "jsonl.gz": ("jsonl.gz", "FORMAT json, COMPRESSION gzip", True),
+    "jsonl.zst": ("jsonl.zst", "FORMAT json, COMPRESSION zstd", True),
+    # DuckDB dictionary-encodes low-cardinality Parquet columns automatically
+    "parquet": ("parquet", "FORMAT parquet, COMPRESSION zstd", True),
+}
+
+# Biolink multivalued slots that Koza's TSV writer joins with LIST_DELIMITER
+MULTIVALUED_COLUMNS = {
+    "category",
+    "xref",
+    "has_gene",
+    "in_taxon",
+    "synonym",
+    "provided_by",
+    "publications",
+    "aggregator_knowledge_source",
+}
+BOOLEAN_COLUMNS = {"negated"}
+LIST_DELIMITER = "|"
+
+
+def load_output_formats(path: Path = FORMATS_YAML) -> dict[str, str]:
+    """Read the transform name -> output format mapping."""
+    if not path.is_file():
+        return {}
+    formats = yaml.safe_load(path.read_text()) or {}
+    for name, fmt in formats.items():
+        if fmt != "tsv" and fmt not in COPY_OPTIONS:
+            raise ValueError(f"Unknown output format for {name}: '{fmt}'")
+    return formats
+
+
+def column_expression(column: str) -> str:
+    """SQL that turns a text KGX column into its typed value (list, boolean or string)."""
+    quoted = '"' + column.replace('"', '""') + '"'
+    if column in MULTIVALUED_COLUMNS:
+        return f"string_split({quoted}, '{LIST_DELIMITER}') AS {quoted}"
+    if column in BOOLEAN_COLUMNS:
+        return f"CAST({quoted} AS BOOLEAN) AS {quoted}"
+    return quoted
+
+
+def convert_tsv(con: duckdb.DuckDBPyConnection, tsv: Path, fmt: str) -> Path:
+    """Stream a KGX TSV into the given format and remove the original."""
+    suffix, options, typed = COPY_OPTIONS[fmt]
+    target = tsv.with_name(f"{tsv.stem}.{suffix}")
+    # Read everything as text with quoting disabled so values round-trip exactly as Koza wrote them
+    source = f"read_csv('{tsv.as_posix()}', delim='\t', header=true, all_varchar=true, quote='', escape='')"
+    columns = "*"
+    if typed:
+        names = [row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()]
+        columns = ", ".join(column_expression(name) for name in names)
+    con.execute(f"COPY (SELECT {columns} FROM {source}) TO '{target.as_posix()}' ({options})")
+    tsv.unlink()
+    return target
+
+
+def convert_output(output_dir: Path = OUTPUT_DIR):
+    """Convert each configured transform's node and edge files."""
+    con = duckdb.connect()
+    for name, fmt in load_output_formats().items():
+        if fmt == "tsv":
+            continue
+        for kind in ("nodes", "edges"):
+            tsv = output_dir / f"{name}_{kind}.tsv"
+            if not tsv.is_file():
+                continue
+            before = tsv.stat().st_size
+            target = convert_tsv(con, tsv, fmt)
+            print(f"{tsv.name} -> {target.name} ({before:,} -> {target.stat().st_size:,} bytes)")
+    con.close()
+
+
+if __name__ == "__main__":
+    convert_output()
@@ -17,15 +17,16 @@ from kozahub_metadata_schema.writer import write_metadata  # noqa: E402
 
 if __name__ == "__main__":
     src = INGEST_DIR / "src"
-    transform_paths = list(src.rglob("*.py")) + list(src.rglob("*.yaml"))
+    # output_formats.yaml lives at the repo root but changes what the build emits
+    transform_paths = list(src.rglob("*.py")) + list(src.rglob("*.yaml")) + [INGEST_DIR / "output_formats.yaml"]
 
     output_dir = INGEST_DIR / "output"
-    # Default to globbing every TSV / NT file in output/ as artifacts.
+    # Default to globbing every TSV / JSONL / Parquet / NT file (compressed or not) in output/ as artifacts.
     # Override the artifacts list explicitly if your ingest produces a fixed set.
     artifacts = sorted(
         p.name
         for p in output_dir.glob("*")
-        if p.is_file() and p.suffix in {".tsv", ".gz", ".jsonl", ".nt"}
+        if p.is_file() and p.suffix in {".tsv", ".gz", ".zst", ".jsonl", ".parquet", ".nt"}
     )
 
     metadata = write_metadata(
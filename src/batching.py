@@ -0,0 +1,70 @@
+"""Shared block-at-a-time driver for the ClinGen transforms.
+
+Koza hands a `@koza.transform` hook the whole input as one iterable. Both
+transforms cut it into blocks of BATCH_SIZE rows and pass each block to their
+`transform_batch`, so per-row costs such as gene symbol lookups are paid once
+per distinct value in the block. `make_hooks` builds the Koza hooks the two
+transforms share, so each module only supplies its `transform_batch`.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+
+import koza
+from koza.model.graphs import KnowledgeGraph
+
+from hgnc_resolver import close_resolver, open_resolver
+
+# Number of rows handed to transform_batch at a time by the Koza hook
+BATCH_SIZE = 1000
+
+
+def iter_batches(rows: Iterable[dict], size: int = BATCH_SIZE) -> Iterator[list[dict]]:
+    """Yield successive lists of up to `size` rows."""
+    rows = iter(rows)
+    while block := list(islice(rows, size)):
+        yield block
+
+
+def transform_in_batches(
+    koza_transform,
+    data: Iterable[dict],
+    transform_batch: Callable[..., KnowledgeGraph],
+    size: int = BATCH_SIZE,
+) -> Iterator[KnowledgeGraph]:
+    """Feed the input to transform_batch in blocks of `size` rows.
+
+    Koza reads the first result to decide how to write the output, so an
+    input with no rows still yields one empty KnowledgeGraph.
+    """
+    empty = True
+    for block in iter_batches(data, size):
+        empty = False
+        yield transform_batch(koza_transform, block)
+    if empty:
+        yield KnowledgeGraph()
+
+
+def make_hooks(report_name: str, transform_batch: Callable[..., KnowledgeGraph]):
+    """Build the Koza hooks for a transform: open the HGNC resolver, transform in blocks, report misses.
+
+    Koza finds hooks by scanning the transform module, so bind the returned
+    hooks to module-level names there.
+    """
+
+    @koza.on_data_begin()
+    def load_hgnc_resolver(koza_transform):
+        """Resolve gene symbols through the persistent HGNC cache for this run."""
+        open_resolver(koza_transform)
+
+    @koza.transform()
+    def transform_rows(koza_transform, data):
+        """Feed the input to transform_batch in blocks of rows."""
+        yield from transform_in_batches(koza_transform, data, transform_batch)
+
+    @koza.on_data_end()
+    def report_hgnc_misses(koza_transform):
+        """Save the HGNC cache and report the symbols that didn't resolve."""
+        close_resolver(koza_transform, report_name)
+
+    return load_hgnc_resolver, transform_rows, report_hgnc_misses
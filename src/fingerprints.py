@@ -0,0 +1,40 @@
+"""File fingerprints for caches derived from downloaded data files.
+
+A fingerprint records a file's size, mtime and sha256. A cached result is
+still valid when the size matches and either the mtime matches or, if only
+the mtime moved (e.g. the file was re-downloaded unchanged), the hash does.
+Hashing is skipped whenever the cheaper checks decide.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any
+
+
+def sha256(path: Path) -> str:
+    """Hex sha256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: Path) -> dict[str, Any]:
+    """Size, mtime and sha256 of a file, as stored alongside a cached result."""
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256(path)}
+
+
+def fingerprint_matches(record: dict[str, Any], path: Path) -> bool:
+    """Whether a stored fingerprint still describes the file.
+
+    Raises KeyError/TypeError for a malformed record and OSError if the file
+    can't be read; callers treat those like a mismatch.
+    """
+    stat = path.stat()
+    if record["size"] != stat.st_size:
+        return False
+    return record["mtime_ns"] == stat.st_mtime_ns or record["sha256"] == sha256(path)
@@ -1,55 +1,73 @@
 """Koza transform for gene-to-disease associations from aggregated ClinGen data."""
 
+import sys
 import uuid
+from pathlib import Path
 
-import koza
 from biolink_model.datamodel.pydanticmodel_v2 import (
     AgentTypeEnum,
     CausalGeneToDiseaseAssociation,
     KnowledgeLevelEnum,
 )
+from koza.model.graphs import KnowledgeGraph
+
+# Koza loads this module by path without touching sys.path, so make the sibling helpers importable
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from batching import make_hooks  # noqa: E402
+from hgnc_resolver import get_resolver  # noqa: E402
 
 # Gene to disease predicates (matching variant-to-disease predicates)
 CAUSES = "biolink:causes"
 ASSOCIATED_WITH_INCREASED_LIKELIHOOD = "biolink:associated_with_increased_likelihood_of"
 
+# Strongest assertion -> predicate
+PREDICATES = {
+    "Pathogenic": CAUSES,
+    "Likely Pathogenic": ASSOCIATED_WITH_INCREASED_LIKELIHOOD,
+}
+
 
 def get_predicate(assertion: str) -> str:
     """Get the predicate based on strongest assertion level."""
-    if assertion == "Pathogenic":
-        return CAUSES
-    elif assertion == "Likely Pathogenic":
-        return ASSOCIATED_WITH_INCREASED_LIKELIHOOD
-    else:
-        raise ValueError(f"Unexpected assertion: '{assertion}'")
+    try:
+        return PREDICATES[assertion]
+    except KeyError:
+        raise ValueError(f"Unexpected assertion: '{assertion}'") from None
+
+
+def transform_batch(koza_transform, rows) -> KnowledgeGraph:
+    """Transform a block of aggregated gene-disease rows to CausalGeneToDiseaseAssociations."""
+    gene_ids = get_resolver(koza_transform).resolve_all(row["gene_symbol"] for row in rows)
+    edges = []
+
+    for row in rows:
+        gene_id = gene_ids[row["gene_symbol"]]
+        if gene_id is None:
+            continue
+
+        strongest_assertion = row["strongest_assertion"]
+        edges.append(
+            CausalGeneToDiseaseAssociation(
+                id=str(uuid.uuid4()),
+                subject=gene_id,
+                predicate=get_predicate(strongest_assertion),
+                object=row["mondo_id"],
+                original_predicate=strongest_assertion,
+                primary_knowledge_source="infores:clingen",
+                aggregator_knowledge_source=["infores:monarchinitiative"],
+                knowledge_level=KnowledgeLevelEnum.knowledge_assertion,
+                agent_type=AgentTypeEnum.manual_agent,
+            )
+        )
+
+    return KnowledgeGraph(edges=edges)
 
 
-@koza.transform_record()
 def transform(koza_transform, row):
     """Transform an aggregated gene-disease row to a CausalGeneToDiseaseAssociation."""
-    gene_symbol = row["gene_symbol"]
-    mondo_id = row["mondo_id"]
-    strongest_assertion = row["strongest_assertion"]
-
-    # Look up HGNC gene ID using koza 2.x API
-    # lookup(name, map_column, map_name) returns the value or the name if not found
-    gene_id = koza_transform.lookup(gene_symbol, "hgnc_id", "hgnc_gene_lookup")
-    # If lookup fails, it returns the input name - so check if it's a valid HGNC ID
-    if gene_id == gene_symbol or not gene_id.startswith("HGNC:"):
-        return []
-
-    predicate = get_predicate(strongest_assertion)
-
-    association = CausalGeneToDiseaseAssociation(
-        id=str(uuid.uuid4()),
-        subject=gene_id,
-        predicate=predicate,
-        object=mondo_id,
-        original_predicate=strongest_assertion,
-        primary_knowledge_source="infores:clingen",
-        aggregator_knowledge_source=["infores:monarchinitiative"],
-        knowledge_level=KnowledgeLevelEnum.knowledge_assertion,
-        agent_type=AgentTypeEnum.manual_agent,
-    )
-
-    return [association]
+    return transform_batch(koza_transform, [row]).edges
+
+
+# Koza discovers hooks by scanning this module, so bind the shared ones here
+load_hgnc_resolver, transform_rows, report_hgnc_misses = make_hooks("clingen_gene_disease", transform_batch)
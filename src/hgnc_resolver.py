@@ -0,0 +1,154 @@
+"""Shared HGNC gene symbol resolution for the ClinGen transforms.
+
+Both transforms map `HGNC Gene Symbol` values to HGNC IDs through the
+`hgnc_gene_lookup` Koza mapping. The resolver keeps an LRU memo for the run
+in `koza_transform.state`, persists resolved symbols to a JSON cache that is
+invalidated when `hgnc_complete_set.txt` changes (size, mtime, sha256) or the
+lookup configuration does (`hgnc_gene_lookup.yaml`, MAP_NAME, MAP_COLUMN), and
+counts every row whose symbol didn't resolve so that the dropped edges can be
+reported once the run finishes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+
+from fingerprints import file_fingerprint, fingerprint_matches
+
+INGEST_DIR = Path(__file__).resolve().parents[1]
+HGNC_FILE = INGEST_DIR / "data" / "hgnc_complete_set.txt"
+CACHE_FILE = INGEST_DIR / "data" / "hgnc_resolution_cache.json"
+MAPPING_FILE = Path(__file__).resolve().parent / "hgnc_gene_lookup.yaml"
+# Kept out of output/ itself so write_metadata.py doesn't pick reports up as artifacts
+REPORT_DIR = INGEST_DIR / "output" / "reports"
+
+MAP_NAME = "hgnc_gene_lookup"
+MAP_COLUMN = "hgnc_id"
+MEMO_SIZE = 8192
+STATE_KEY = "hgnc_resolver"
+
+
+class HGNCResolver:
+    """Resolve gene symbols to HGNC IDs, memoizing lookups and counting misses.
+
+    The LRU memo is the only in-run memo. Resolutions loaded from the persisted
+    cache are read-only seed data, consulted when a symbol misses the memo;
+    symbols found in neither are looked up through Koza and recorded for `save`.
+    """
+
+    def __init__(
+        self,
+        koza_transform,
+        cache_path: Path | None = None,
+        hgnc_path: Path = HGNC_FILE,
+        mapping_path: Path = MAPPING_FILE,
+    ):
+        self.koza_transform = koza_transform
+        self.cache_path = cache_path
+        self.hgnc_path = hgnc_path
+        self.mapping_path = mapping_path
+        self.persisted: dict[str, str | None] = self._load_cache() if cache_path else {}
+        self.resolved: dict[str, str | None] = {}
+        self.persisted_hits = 0
+        self.misses: Counter[str] = Counter()
+        self._memo_lookup = lru_cache(maxsize=MEMO_SIZE)(self._lookup)
+
+    def _mapping_fingerprint(self) -> str:
+        """Hash of the lookup configuration that every resolution depends on."""
+        digest = hashlib.sha256(f"{MAP_NAME}\t{MAP_COLUMN}\n".encode())
+        if self.mapping_path.is_file():
+            digest.update(self.mapping_path.read_bytes())
+        return digest.hexdigest()
+
+    def _load_cache(self) -> dict[str, str | None]:
+        """Read the persisted resolutions, discarding them if the HGNC file or lookup config changed."""
+        if not self.hgnc_path.is_file() or not self.cache_path.is_file():
+            return {}
+        try:
+            record = json.loads(self.cache_path.read_text())
+            hgnc = record["hgnc"]
+            if hgnc["mapping"] != self._mapping_fingerprint() or not fingerprint_matches(hgnc, self.hgnc_path):
+                return {}
+            return record["resolved"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def save(self) -> None:
+        """Persist every known resolution, keyed on the current HGNC file and lookup config."""
+        if self.cache_path is None or not self.hgnc_path.is_file():
+            return
+        fingerprint = {**file_fingerprint(self.hgnc_path), "mapping": self._mapping_fingerprint()}
+        resolved = {**self.persisted, **self.resolved}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps({"hgnc": fingerprint, "resolved": resolved}, indent=2) + "\n")
+
+    def _lookup(self, gene_symbol: str) -> str | None:
+        if gene_symbol in self.persisted:
+            self.persisted_hits += 1
+            return self.persisted[gene_symbol]
+        gene_id = self.koza_transform.lookup(gene_symbol, MAP_COLUMN, MAP_NAME)
+        # If lookup fails, it returns the input name - so check if it's a valid HGNC ID
+        if gene_id == gene_symbol or not gene_id.startswith("HGNC:"):
+            gene_id = None
+        self.resolved[gene_symbol] = gene_id
+        return gene_id
+
+    def resolve_all(self, gene_symbols: Iterable[str]) -> dict[str, str | None]:
+        """Resolve a block of symbols (one per row), looking each distinct symbol up once."""
+        counts = Counter(gene_symbols)
+        gene_ids = {gene_symbol: self._memo_lookup(gene_symbol) for gene_symbol in counts}
+        for gene_symbol, gene_id in gene_ids.items():
+            if gene_id is None:
+                self.misses[gene_symbol] += counts[gene_symbol]
+        return gene_ids
+
+    def stats(self) -> dict[str, int]:
+        """Where resolutions came from: the run's memo, the persisted cache, or a Koza lookup."""
+        return {
+            "memo_hits": self._memo_lookup.cache_info().hits,
+            "persisted_hits": self.persisted_hits,
+            "lookups": len(self.resolved),
+            "unresolved_rows": sum(self.misses.values()),
+            "unresolved_symbols": len(self.misses),
+        }
+
+    def write_miss_report(self, path: Path) -> None:
+        """Write the unresolved symbols and how many rows each occurred in, most frequent first."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as fh:
+            fh.write("gene_symbol\tcount\n")
+            for gene_symbol, count in self.misses.most_common():
+                fh.write(f"{gene_symbol}\t{count}\n")
+
+
+def get_resolver(koza_transform) -> HGNCResolver:
+    """Return the resolver for this run, creating an in-memory one if the run didn't open one."""
+    if STATE_KEY not in koza_transform.state:
+        koza_transform.state[STATE_KEY] = HGNCResolver(koza_transform)
+    return koza_transform.state[STATE_KEY]
+
+
+def open_resolver(koza_transform) -> HGNCResolver:
+    """Start a run with a resolver backed by the persistent cache."""
+    resolver = HGNCResolver(koza_transform, cache_path=CACHE_FILE)
+    koza_transform.state[STATE_KEY] = resolver
+    return resolver
+
+
+def close_resolver(koza_transform, report_name: str) -> None:
+    """Persist the cache and write the miss report for a finished run."""
+    resolver = get_resolver(koza_transform)
+    resolver.save()
+    report_path = REPORT_DIR / f"{report_name}_unresolved_hgnc_symbols.tsv"
+    resolver.write_miss_report(report_path)
+    stats = resolver.stats()
+    koza_transform.log(
+        f"HGNC resolution: {stats['memo_hits']} memo hits, {stats['persisted_hits']} from the persisted cache, "
+        f"{stats['lookups']} looked up; {stats['unresolved_rows']} unresolved rows across "
+        f"{stats['unresolved_symbols']} symbols (see {report_path})"
+    )
@@ -9,25 +9,32 @@ header, no version preamble in the file, no /info endpoint). Instead we
 derive a version from the data itself: `max("Published Date")` across
 the TSV. That date moves forward as new classifications are curated and
 agrees across two fetches iff the dataset is unchanged.
+
+The scan is done once, when the TSV is staged, and recorded in a JSON
+sidecar next to it (`clingen_variants.tsv.version.json`) keyed on the
+file's size, mtime and sha256. Metadata emission reads the sidecar and
+only rescans when the file no longer matches it.
 """
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any
 
 import duckdb
-
 from kozahub_metadata_schema import (
     now_iso,
     urls_from_download_yaml,
     version_from_http_last_modified,
 )
 
+from fingerprints import file_fingerprint, fingerprint_matches
 
 INGEST_DIR = Path(__file__).resolve().parents[1]
 DOWNLOAD_YAML = INGEST_DIR / "download.yaml"
 CLINGEN_TSV = INGEST_DIR / "data" / "clingen_variants.tsv"
+SIDECAR_SUFFIX = ".version.json"
 
 
 def version_from_clingen_tsv(path: Path) -> tuple[str, str]:
@@ -46,6 +53,61 @@ def version_from_clingen_tsv(path: Path) -> tuple[str, str]:
     return result[0].isoformat(), "max_published_date"
 
 
+def sidecar_path(path: Path) -> Path:
+    """Location of the version sidecar for a staged TSV."""
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def write_clingen_version_sidecar(path: Path) -> tuple[str, str]:
+    """Scan the TSV once and record its version in a sidecar keyed on size, mtime and hash.
+
+    The sidecar is only an optimization: if it can't be written (e.g. a
+    read-only data/ directory) the scanned version is still returned.
+    """
+    ver, method = version_from_clingen_tsv(path)
+    if ver == "unknown":
+        return ver, method
+    try:
+        sidecar_path(path).write_text(json.dumps({
+            **file_fingerprint(path),
+            "version": ver,
+            "version_method": method,
+        }, indent=2) + "\n")
+    except OSError:
+        pass
+    return ver, method
+
+
+def read_clingen_version_sidecar(path: Path) -> tuple[str, str] | None:
+    """Return the recorded version if the sidecar still matches the TSV, else None.
+
+    Size and mtime are checked first; if only the mtime moved (e.g. the file
+    was re-downloaded unchanged) the hash decides, and the sidecar is refreshed.
+    """
+    sidecar = sidecar_path(path)
+    if not path.is_file() or not sidecar.is_file():
+        return None
+    try:
+        record = json.loads(sidecar.read_text())
+        if not fingerprint_matches(record, path):
+            return None
+        mtime_ns = path.stat().st_mtime_ns
+        if record["mtime_ns"] != mtime_ns:
+            record["mtime_ns"] = mtime_ns
+            sidecar.write_text(json.dumps(record, indent=2) + "\n")
+        return record["version"], record["version_method"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def cached_version_from_clingen_tsv(path: Path) -> tuple[str, str]:
+    """Read the ClinGen version from its sidecar, rescanning only when stale."""
+    cached = read_clingen_version_sidecar(path)
+    if cached is not None:
+        return cached
+    return write_clingen_version_sidecar(path)
+
+
 def get_source_versions() -> list[dict[str, Any]]:
     clingen_urls = urls_from_download_yaml(DOWNLOAD_YAML, contains=["clinicalgenome.org"])
     hgnc_urls = urls_from_download_yaml(DOWNLOAD_YAML, contains=["public-download-files/hgnc"])
@@ -54,7 +116,7 @@ def get_source_versions() -> list[dict[str, Any]]:
     sources: list[dict[str, Any]] = []
 
     if clingen_urls:
-        ver, method = version_from_clingen_tsv(CLINGEN_TSV)
+        ver, method = cached_version_from_clingen_tsv(CLINGEN_TSV)
         sources.append({
             "id": "infores:clingen",
             "name": "ClinGen — Clinical Genome Resource",
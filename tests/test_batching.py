@@ -0,0 +1,44 @@
+"""
+Tests for the shared block-at-a-time transform driver.
+"""
+
+from koza.model.graphs import KnowledgeGraph
+from koza.runner import KozaTransform, PassthroughWriter
+
+from batching import iter_batches, transform_in_batches
+
+
+def test_iter_batches():
+    """Test that rows are split into full blocks plus a shorter final block."""
+    rows = [{"n": n} for n in range(5)]
+
+    assert [len(block) for block in iter_batches(rows, size=2)] == [2, 2, 1]
+    assert list(iter_batches([], size=2)) == []
+
+
+def test_transform_in_batches():
+    """Test that every row reaches transform_batch exactly once, in order."""
+    koza_transform = KozaTransform(mappings={}, writer=PassthroughWriter(), extra_fields={})
+    seen = []
+
+    def transform_batch(koza_transform, rows):
+        seen.append([row["n"] for row in rows])
+        return KnowledgeGraph()
+
+    graphs = list(transform_in_batches(koza_transform, iter({"n": n} for n in range(3)), transform_batch, size=2))
+
+    assert len(graphs) == 2
+    assert seen == [[0, 1], [2]]
+
+
+def test_transform_in_batches_empty_input():
+    """Test that an input with no rows still yields one empty graph for Koza to write."""
+    koza_transform = KozaTransform(mappings={}, writer=PassthroughWriter(), extra_fields={})
+
+    def transform_batch(koza_transform, rows):
+        raise AssertionError("transform_batch should not be called without rows")
+
+    graphs = list(transform_in_batches(koza_transform, iter([]), transform_batch))
+
+    assert len(graphs) == 1
+    assert graphs[0].nodes == [] and graphs[0].edges == []
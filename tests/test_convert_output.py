@@ -0,0 +1,90 @@
+"""
+Tests for converting Koza's KGX TSV output into the configured output formats.
+
+Each format is read back with DuckDB and compared to the original TSV, with
+multivalued columns split on "|" and `negated` parsed as a boolean for the
+typed (JSONL and Parquet) formats.
+"""
+
+import duckdb
+import pytest
+
+from convert_output import BOOLEAN_COLUMNS, COPY_OPTIONS, LIST_DELIMITER, MULTIVALUED_COLUMNS, convert_tsv
+
+NODES_TSV = (
+    "id\tname\tcategory\txref\thas_gene\tin_taxon\tin_taxon_label\n"
+    "CLINVAR:586\tNM_000277.2(PAH):c.1A>G (p.Met1Val)\tbiolink:SequenceVariant\tCAID:CA114360\tHGNC:8582"
+    "\tNCBITaxon:9606\tHomo sapiens\n"
+    "CAID:CA0\tNM_0.1:c.2T>A\tbiolink:SequenceVariant\tCAID:CA0\t\tNCBITaxon:9606\tHomo sapiens\n"
+)
+
+EDGES_TSV = (
+    "id\tsubject\tpredicate\tobject\tnegated\toriginal_predicate\tcategory\tknowledge_level\tagent_type"
+    "\tprimary_knowledge_source\taggregator_knowledge_source\n"
+    "uuid:1\tCLINVAR:586\tbiolink:causes\tMONDO:0009861\tFalse\tPathogenic"
+    "\tbiolink:VariantToDiseaseAssociation\tknowledge_assertion\tmanual_agent\tinfores:clingen"
+    "\tinfores:monarchinitiative\n"
+    "uuid:2\tCAID:CA0\tbiolink:genetically_associated_with\tMONDO:0009861\tTrue\tUncertain Significance"
+    "\tbiolink:VariantToDiseaseAssociation|biolink:Association\tknowledge_assertion\tmanual_agent"
+    "\tinfores:clingen\tinfores:monarchinitiative|infores:example\n"
+)
+
+
+def expected_rows(text: str, typed: bool) -> list[dict]:
+    """Parse a KGX TSV the way each format should represent it."""
+    header, *lines = text.splitlines()
+    columns = header.split("\t")
+    rows = []
+    for line in lines:
+        row = {}
+        for column, value in zip(columns, line.split("\t")):
+            if value == "":
+                value = None
+            elif typed and column in MULTIVALUED_COLUMNS:
+                value = value.split(LIST_DELIMITER)
+            elif typed and column in BOOLEAN_COLUMNS:
+                value = value == "True"
+            row[column] = value
+        rows.append(row)
+    return rows
+
+
+def read_back(path, fmt: str) -> list[dict]:
+    if fmt.startswith("tsv"):
+        source = f"read_csv('{path.as_posix()}', delim='\t', header=true, all_varchar=true, quote='', escape='')"
+    elif fmt.startswith("jsonl"):
+        source = f"read_json('{path.as_posix()}', format='newline_delimited')"
+    else:
+        source = f"read_parquet('{path.as_posix()}')"
+    result = duckdb.sql(f"SELECT * FROM {source}")
+    return [dict(zip(result.columns, row)) for row in result.fetchall()]
+
+
+@pytest.mark.parametrize("fmt", sorted(COPY_OPTIONS))
+@pytest.mark.parametrize("kind, text", [("nodes", NODES_TSV), ("edges", EDGES_TSV)])
+def test_convert_tsv_round_trips(tmp_path, fmt, kind, text):
+    """Test that every output format reads back as the same records as the TSV."""
+    tsv = tmp_path / f"clingen_variant_{kind}.tsv"
+    tsv.write_text(text)
+
+    with duckdb.connect() as con:
+        target = convert_tsv(con, tsv, fmt)
+
+    assert target.name == f"clingen_variant_{kind}.{COPY_OPTIONS[fmt][0]}"
+    assert not tsv.exists()
+    assert read_back(target, fmt) == expected_rows(text, typed=COPY_OPTIONS[fmt][2])
+
+
+def test_typed_columns(tmp_path):
+    """Test that Parquet stores multivalued columns as lists and negated as a boolean."""
+    tsv = tmp_path / "clingen_variant_edges.tsv"
+    tsv.write_text(EDGES_TSV)
+
+    with duckdb.connect() as con:
+        target = convert_tsv(con, tsv, "parquet")
+        described = con.execute(f"DESCRIBE SELECT * FROM read_parquet('{target.as_posix()}')").fetchall()
+        types = {row[0]: row[1] for row in described}
+
+    assert types["negated"] == "BOOLEAN"
+    assert types["aggregator_knowledge_source"] == "VARCHAR[]"
+    assert types["subject"] == "VARCHAR"
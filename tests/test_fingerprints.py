@@ -0,0 +1,37 @@
+"""
+Tests for the shared file fingerprints used to invalidate caches.
+"""
+
+import os
+
+import pytest
+
+from fingerprints import file_fingerprint, fingerprint_matches
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "hgnc_complete_set.txt"
+    path.write_text("hgnc_id\tsymbol\nHGNC:8582\tPAH\n")
+    return path
+
+
+def test_unchanged_and_touched(data_file):
+    """Test that a fingerprint survives a new mtime as long as the content is the same."""
+    record = file_fingerprint(data_file)
+    assert fingerprint_matches(record, data_file)
+
+    stat = data_file.stat()
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert fingerprint_matches(record, data_file)
+
+
+def test_changed_content(data_file):
+    """Test that different content of the same size, or a different size, doesn't match."""
+    record = file_fingerprint(data_file)
+
+    data_file.write_text("hgnc_id\tsymbol\nHGNC:8583\tPAH\n")
+    assert not fingerprint_matches(record, data_file)
+
+    data_file.write_text("hgnc_id\tsymbol\n")
+    assert not fingerprint_matches(record, data_file)
@@ -10,7 +10,7 @@ Uses KozaRunner with PassthroughWriter for Koza 2.x testing.
 import pytest
 from koza.runner import KozaTransform, PassthroughWriter
 
-from gene_disease_transform import transform
+from gene_disease_transform import transform, transform_batch
 
 
 def run_transform(rows: list[dict], mappings: dict = None) -> list:
@@ -134,3 +134,16 @@ def test_invalid_assertion(pathogenic_row, mappings):
     with pytest.raises(ValueError) as e_info:
         run_transform([row], mappings=mappings)
     assert "Unexpected assertion" in str(e_info.value)
+
+
+def test_transform_batch(pathogenic_row, likely_pathogenic_row, unknown_gene_row, mappings):
+    """Test that a block of rows resolves genes together and skips unknown genes."""
+    koza_transform = KozaTransform(mappings=mappings, writer=PassthroughWriter(), extra_fields={})
+
+    graph = transform_batch(koza_transform, [pathogenic_row, unknown_gene_row, likely_pathogenic_row])
+
+    assert graph.nodes == []
+    assert [(edge.subject, edge.predicate) for edge in graph.edges] == [
+        ("HGNC:8582", "biolink:causes"),
+        ("HGNC:1100", "biolink:associated_with_increased_likelihood_of"),
+    ]
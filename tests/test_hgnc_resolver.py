@@ -0,0 +1,105 @@
+"""
+Tests for the shared HGNC gene symbol resolver.
+"""
+
+import os
+
+import pytest
+from koza.runner import KozaTransform, PassthroughWriter
+
+from hgnc_resolver import HGNCResolver, get_resolver
+
+
+@pytest.fixture
+def koza_transform():
+    """KozaTransform with an HGNC gene lookup for PAH only."""
+    return KozaTransform(
+        mappings={"hgnc_gene_lookup": {"PAH": {"hgnc_id": "HGNC:8582"}}},
+        writer=PassthroughWriter(),
+        extra_fields={},
+    )
+
+
+@pytest.fixture
+def hgnc_file(tmp_path):
+    path = tmp_path / "hgnc_complete_set.txt"
+    path.write_text("hgnc_id\tsymbol\nHGNC:8582\tPAH\n")
+    return path
+
+
+@pytest.fixture
+def mapping_file(tmp_path):
+    path = tmp_path / "hgnc_gene_lookup.yaml"
+    path.write_text("name: 'hgnc_gene_lookup'\ntransform:\n  key: symbol\n  values:\n    - hgnc_id\n")
+    return path
+
+
+@pytest.fixture
+def saved_cache(koza_transform, hgnc_file, mapping_file, tmp_path):
+    """A persisted cache holding one resolved and one unresolved symbol."""
+    cache = tmp_path / "hgnc_resolution_cache.json"
+    resolver = HGNCResolver(koza_transform, cache_path=cache, hgnc_path=hgnc_file, mapping_path=mapping_file)
+    resolver.resolve_all(["PAH", "NOPE"])
+    resolver.save()
+    return cache
+
+
+def test_resolve_all_counts_misses_per_row(koza_transform):
+    """Test that unresolved symbols are counted once per row they occur in."""
+    resolver = get_resolver(koza_transform)
+
+    assert resolver.resolve_all(["PAH", "NOPE", "PAH", "NOPE"]) == {"PAH": "HGNC:8582", "NOPE": None}
+    resolver.resolve_all(["NOPE", "N/A"])
+
+    assert resolver.misses == {"NOPE": 3, "N/A": 1}
+    assert resolver.stats()["memo_hits"] == 1
+    assert resolver.stats()["lookups"] == 3
+    assert get_resolver(koza_transform) is resolver
+
+
+def test_write_miss_report(koza_transform, tmp_path):
+    """Test that the miss report lists the most frequent symbols first."""
+    resolver = get_resolver(koza_transform)
+    resolver.resolve_all(["N/A", "NOPE", "NOPE"])
+
+    report = tmp_path / "reports" / "unresolved.tsv"
+    resolver.write_miss_report(report)
+
+    assert report.read_text() == "gene_symbol\tcount\nNOPE\t2\nN/A\t1\n"
+
+
+def test_persistent_cache(koza_transform, hgnc_file, mapping_file, saved_cache):
+    """Test that saved resolutions seed the next run instead of Koza lookups."""
+    reloaded = HGNCResolver(koza_transform, cache_path=saved_cache, hgnc_path=hgnc_file, mapping_path=mapping_file)
+    assert reloaded.persisted == {"PAH": "HGNC:8582", "NOPE": None}
+
+    reloaded.resolve_all(["PAH", "NOPE", "PAH"])
+    reloaded.resolve_all(["PAH"])
+    assert reloaded.stats()["persisted_hits"] == 2
+    assert reloaded.stats()["memo_hits"] == 1
+    assert reloaded.stats()["lookups"] == 0
+
+
+def test_persistent_cache_touched_hgnc_file(koza_transform, hgnc_file, mapping_file, saved_cache):
+    """Test that a new mtime on an unchanged HGNC file keeps the cache."""
+    stat = hgnc_file.stat()
+    os.utime(hgnc_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = HGNCResolver(koza_transform, cache_path=saved_cache, hgnc_path=hgnc_file, mapping_path=mapping_file)
+    assert reloaded.persisted == {"PAH": "HGNC:8582", "NOPE": None}
+    reloaded.resolve_all(["PAH"])
+    assert reloaded.stats()["persisted_hits"] == 1
+
+
+def test_persistent_cache_invalidation(koza_transform, hgnc_file, mapping_file, saved_cache):
+    """Test that changing the HGNC file or the lookup config discards the cache."""
+
+    def reload():
+        return HGNCResolver(koza_transform, cache_path=saved_cache, hgnc_path=hgnc_file, mapping_path=mapping_file)
+
+    mapping_file.write_text(mapping_file.read_text().replace("key: symbol", "key: alias_symbol"))
+    assert reload().persisted == {}
+
+    mapping_file.write_text(mapping_file.read_text().replace("key: alias_symbol", "key: symbol"))
+    hgnc_file.write_text("hgnc_id\tsymbol\nHGNC:8582\tPAH\nHGNC:99\tNOPE\n")
+    assert reload().persisted == {}
@@ -244,3 +244,32 @@ def test_invalid_clinical_significance(correct_row, mappings):
     with pytest.raises(ValueError) as e_info:
         run_transform([row], mappings=mappings)
     assert "Not sure how to handle _assertion: 'Invalid'" in str(e_info.value)
+
+
+# Test that a block of rows produces the same entities as transforming them one at a time
+def test_transform_batch(correct_row, mappings):
+    clingen_variant_transform.seen_variants = {}
+    koza_transform = KozaTransform(mappings=mappings, writer=PassthroughWriter(), extra_fields={})
+
+    benign_row = correct_row.copy()
+    benign_row["Assertion"] = "Benign"
+    second_disease_row = correct_row.copy()
+    second_disease_row["Mondo Id"] = "MONDO:0000001"
+    no_clinvar_row = correct_row.copy()
+    no_clinvar_row["ClinVar Variation Id"] = "-"
+    no_clinvar_row["HGNC Gene Symbol"] = "UNKNOWN_GENE"
+
+    graph = clingen_variant_transform.transform_batch(
+        koza_transform, [correct_row, benign_row, second_disease_row, no_clinvar_row]
+    )
+
+    # The variant seen twice in the block is only emitted once
+    assert [node.id for node in graph.nodes] == ['CLINVAR:586', 'CAID:CA114360']
+    assert graph.nodes[1].has_gene is None
+    assert [(edge.subject, edge.object) for edge in graph.edges] == [
+        ('CLINVAR:586', 'MONDO:0009861'),
+        ('CLINVAR:586', 'HGNC:8582'),
+        ('CLINVAR:586', 'MONDO:0000001'),
+        ('CLINVAR:586', 'HGNC:8582'),
+        ('CAID:CA114360', 'MONDO:0009861'),
+    ]
@@ -0,0 +1,108 @@
+"""
+Tests for the cached ClinGen source version sidecar.
+"""
+
+import json
+import os
+
+import pytest
+
+import versions
+from versions import cached_version_from_clingen_tsv, read_clingen_version_sidecar, sidecar_path
+
+HEADER = "Variation\tHGNC Gene Symbol\tPublished Date\n"
+
+
+@pytest.fixture
+def clingen_tsv(tmp_path):
+    path = tmp_path / "clingen_variants.tsv"
+    path.write_text(HEADER + "v1\tPAH\t2019-05-10\nv2\tPAH\t2021-02-03\n")
+    return path
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Count the DuckDB scans of the TSV."""
+    calls = []
+    scan = versions.version_from_clingen_tsv
+
+    def counting_scan(path):
+        calls.append(path)
+        return scan(path)
+
+    monkeypatch.setattr(versions, "version_from_clingen_tsv", counting_scan)
+    return calls
+
+
+def test_cache_hit(clingen_tsv, scans):
+    """Test that the sidecar is written on the first read and reused afterwards."""
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2021-02-03", "max_published_date")
+    assert sidecar_path(clingen_tsv).is_file()
+
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2021-02-03", "max_published_date")
+    assert len(scans) == 1
+
+
+def test_touched_but_unchanged_file(clingen_tsv, scans):
+    """Test that a new mtime with the same content refreshes the sidecar without rescanning."""
+    cached_version_from_clingen_tsv(clingen_tsv)
+    stat = clingen_tsv.stat()
+    os.utime(clingen_tsv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2021-02-03", "max_published_date")
+    assert len(scans) == 1
+    record = json.loads(sidecar_path(clingen_tsv).read_text())
+    assert record["mtime_ns"] == clingen_tsv.stat().st_mtime_ns
+
+
+def test_appended_row(clingen_tsv, scans):
+    """Test that an appended row invalidates the sidecar and the new date is picked up."""
+    cached_version_from_clingen_tsv(clingen_tsv)
+    with clingen_tsv.open("a") as fh:
+        fh.write("v3\tPAH\t2024-07-01\n")
+
+    assert read_clingen_version_sidecar(clingen_tsv) is None
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2024-07-01", "max_published_date")
+    assert len(scans) == 2
+
+
+def test_size_mismatch(clingen_tsv, scans):
+    """Test that a sidecar whose recorded size differs from the TSV is ignored."""
+    cached_version_from_clingen_tsv(clingen_tsv)
+    sidecar = sidecar_path(clingen_tsv)
+    record = json.loads(sidecar.read_text())
+    record["size"] += 1
+    record["version"] = "1999-01-01"
+    sidecar.write_text(json.dumps(record))
+
+    assert read_clingen_version_sidecar(clingen_tsv) is None
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2021-02-03", "max_published_date")
+    assert len(scans) == 2
+
+
+def test_missing_file(tmp_path):
+    """Test that a missing TSV reports an unknown version and writes no sidecar."""
+    path = tmp_path / "clingen_variants.tsv"
+
+    assert cached_version_from_clingen_tsv(path) == ("unknown", "unavailable")
+    assert not sidecar_path(path).exists()
+
+
+def test_malformed_sidecar(clingen_tsv, scans):
+    """Test that a sidecar holding valid JSON that isn't a record falls back to a scan."""
+    sidecar_path(clingen_tsv).write_text("[]")
+
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2021-02-03", "max_published_date")
+    assert len(scans) == 1
+
+
+def test_unwritable_sidecar(clingen_tsv, scans, monkeypatch):
+    """Test that failing to write the sidecar still returns the scanned version."""
+
+    def read_only(self, *args, **kwargs):
+        raise PermissionError(f"read-only: {self}")
+
+    monkeypatch.setattr(type(clingen_tsv), "write_text", read_only)
+
+    assert cached_version_from_clingen_tsv(clingen_tsv) == ("2021-02-03", "max_published_date")
+    assert not sidecar_path(clingen_tsv).exists()